@@ -5,23 +5,38 @@ Provides endpoints for Google ID token validation and user authentication
 that integrate with the existing auth middleware and user management system.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi import APIRouter, Cookie, HTTPException, Depends, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 import os
 
 from app.core.logging import get_logger
 from app.api.dependencies import SessionDep
 from app.api.dependencies_rate_limit import RateLimiter
 from app.middleware.auth import verify_google_id_token_claims, get_current_user
-from app.middleware.session_auth import get_session_user
+from app.middleware.session_auth import get_session_user, get_session_payload
 from app.models.database import User
 from app.core.exceptions import AuthenticationError
-from app.core.session import create_session_token, get_cookie_settings, get_logout_cookie_settings
+from app.core.session import (
+    create_session_token,
+    get_cookie_settings,
+    get_logout_cookie_settings,
+    invalidate_session,
+)
 
 logger = get_logger(__name__)
-router = APIRouter()
+# orjson serializes these responses natively (datetimes included), moving
+# JSON encoding for the auth hot path out of the interpreter
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Deployment environment is static for the process lifetime; evaluate once
+# instead of re-reading the env var on every login
+_IS_PRODUCTION = os.getenv("ENVIRONMENT", "development").lower() == "production"
 
 
 class GoogleAuthRequest(BaseModel):
@@ -55,7 +70,7 @@ class AuthResponse(BaseModel):
 
 
 @router.post("/google")
-async def google_auth(
+def google_auth(
     request: GoogleAuthRequest,
     response: Response,
     session: SessionDep,
@@ -98,12 +113,16 @@ async def google_auth(
         
         logger.info(f"Verified Google token for user: {email}")
         
-        # Check if user exists in database by Google ID first, then email
-        user = session.query(User).filter(User.google_id == google_id).first()
-        if not user:
-            # Also check by email in case user exists but without Google ID
-            user = session.query(User).filter(User.email == email).first()
-        
+        # Check if user exists in database by Google ID or email in a single
+        # round-trip, preferring the Google-ID match (email covers legacy
+        # accounts created before their Google ID was stored)
+        candidates = session.query(User).filter(
+            or_(User.google_id == google_id, User.email == email)
+        ).limit(2).all()
+        user = next((u for u in candidates if u.google_id == google_id), None)
+        if not user and candidates:
+            user = candidates[0]
+
         if not user:
             # Create new user
             logger.info(f"Creating new user account for: {email}")
@@ -117,9 +136,23 @@ async def google_auth(
                 created_at=datetime.now()
             )
             session.add(user)
-            session.commit()
-            session.refresh(user)
-            logger.info(f"Created new user with ID: {user.id}")
+            try:
+                session.commit()
+            except IntegrityError:
+                # A concurrent first login inserted this user between our
+                # SELECT and this INSERT; adopt the committed row instead
+                # of surfacing a 500.
+                session.rollback()
+                logger.info(f"Concurrent signup detected for {email}, reusing existing account")
+                user = session.query(User).filter(User.email == email).first()
+                if user is None:
+                    raise
+                if user.google_id != google_id:
+                    user.google_id = google_id
+                    session.commit()
+            else:
+                session.refresh(user)
+                logger.info(f"Created new user with ID: {user.id}")
         else:
             # Update existing user's Google ID if needed
             if user.google_id != google_id:
@@ -136,13 +169,16 @@ async def google_auth(
                 "user_db_id": str(user.id),
                 "name": name,
                 "picture": picture,
-                "subscription_tier": user.subscription_tier
+                "subscription_tier": user.subscription_tier,
+                # Serialized so profile reads can answer straight from the token
+                "google_id": user.google_id,
+                "created_at": user.created_at.isoformat(),
+                "is_active": user.is_active
             }
         )
         
-        # Set session cookie (check if we're in production for Secure flag)
-        is_production = os.getenv("ENVIRONMENT", "development").lower() == "production"
-        cookie_settings = get_cookie_settings(secure=is_production)
+        # Set session cookie (Secure flag only in production)
+        cookie_settings = get_cookie_settings(secure=_IS_PRODUCTION)
         response.set_cookie(value=session_token, **cookie_settings)
         
         # Create response data
@@ -174,22 +210,27 @@ async def google_auth(
 @router.post("/logout")
 async def logout(
     response: Response,
-    user_id: str = Depends(get_session_user)
+    user_id: str = Depends(get_session_user),
+    pm_session: Optional[str] = Cookie(None)
 ):
     """
     Logout Endpoint
-    
+
     Clears the backend session cookie to log out the user.
-    
+
     Args:
         response: FastAPI response object for clearing cookies
         user_id: Current user ID from session (ensures user is authenticated)
-        
+        pm_session: Session cookie value, used to drop the cached verification
+
     Returns:
         dict: Success message
     """
     logger.info(f"Processing logout request for user: {user_id}")
-    
+
+    # Drop any cached verification result before clearing the cookie
+    invalidate_session(pm_session)
+
     # Clear the session cookie
     logout_cookie_settings = get_logout_cookie_settings()
     response.set_cookie(**logout_cookie_settings)
@@ -220,44 +261,64 @@ async def validate_token(current_user: str = Depends(get_current_user)):
 
 
 @router.get("/me")
-async def get_current_user_info(
+def get_current_user_info(
     session: SessionDep,
-    user_id: str = Depends(get_session_user)
+    payload: Dict[str, Any] = Depends(get_session_payload)
 ):
     """
     Get Current User Information
-    
+
     Returns current user information based on session cookie authentication.
-    
+    Answered straight from the session token claims stashed at login;
+    only tokens minted before those claims existed fall back to the DB.
+
     Args:
-        session: Database session
-        user_id: User ID from session cookie
-        
+        session: Database session (fallback lookup for legacy tokens)
+        payload: Verified session token payload
+
     Returns:
         UserResponse: Current user information
-        
+
     Raises:
         HTTPException: 404 if user not found, 401 if session invalid
     """
+    user_id = payload["user_id"]
+    email = payload["email"]
     logger.info(f"Fetching user info for: {user_id}")
-    
-    # Look up user in database
-    user = session.query(User).filter(User.email == user_id).first()
+
+    # Everything this response needs is serialized into the token at login,
+    # so the common case is answered without touching the database
+    if all(payload.get(claim) is not None
+           for claim in ("user_db_id", "subscription_tier", "created_at", "is_active")):
+        return UserResponse(
+            id=str(payload["user_db_id"]),
+            email=email,
+            name=payload.get("name") or email.split("@", 1)[0],
+            picture=payload.get("picture"),
+            role="USER",
+            subscription_tier=payload["subscription_tier"],
+            created_at=payload["created_at"],
+            is_active=payload["is_active"]
+        )
+
+    # Legacy token without the serialized claims: look up the user instead
+    user = session.query(User).options(
+        load_only(User.id, User.email, User.subscription_tier, User.is_active, User.created_at)
+    ).filter(User.email == user_id).first()
     if not user:
         logger.warning(f"User not found in database: {user_id}")
         raise HTTPException(status_code=404, detail="User not found")
-    
-    # Return user information
+
     user_response = UserResponse(
         id=str(user.id),
         email=user.email,
-        name=user.email.split('@')[0],  # Fallback if no name stored
-        picture=None,  # Will be filled from session token if available
+        name=payload.get("name") or user.email.split("@", 1)[0],
+        picture=payload.get("picture"),
         role="USER",
         subscription_tier=user.subscription_tier,
         created_at=user.created_at.isoformat(),
         is_active=user.is_active
     )
-    
+
     logger.info(f"Successfully fetched user info for: {user_id}")
     return user_response
\ No newline at end of file
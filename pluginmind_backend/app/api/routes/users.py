@@ -5,18 +5,19 @@ Provides authenticated user access to their profile information,
 usage statistics, and account management features.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, Optional
 from app.core.logging import get_logger
 from app.api.dependencies import SessionDep
-from app.middleware.session_auth import get_session_user
-from app.services.user_service import user_service
-from app.models.schemas import UserProfile, UserUsage
+from app.middleware.session_auth import get_session_user, get_session_payload
+from app.services.user_service import user_service, UserView
+from app.models.schemas import UserProfile, UserUsage, UserSummary
 from app.core.exceptions import UserNotFoundError
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class FrontendUserResponse(BaseModel):
@@ -36,32 +37,54 @@ class UserProfileResponse(BaseModel):
     user: FrontendUserResponse
 
 
-@router.get("/me", response_model=UserProfile)
-async def get_current_user_profile(session: SessionDep, user_id: str = Depends(get_session_user)):
+def _load_current_user(
+    request: Request,
+    session: SessionDep,
+    user_id: str = Depends(get_session_user)
+) -> UserView:
     """
-    Get Current User Profile (Session Cookie Auth)
-    
-    Returns the authenticated user's profile information including
-    email, subscription tier, account status, and creation date.
-    
+    FastAPI dependency that loads the authenticated user once per request.
+
+    The loaded view is stashed on request.state, so every endpoint or
+    sub-dependency needing the current user shares a single lookup per
+    request; repeat requests are served from the user-view TTL cache
+    without touching the database at all.
+
     Args:
+        request: FastAPI request object (carries the per-request cache)
         session: Database session
         user_id: Authenticated user ID from session cookie
-        
+
     Returns:
-        UserProfile: User profile information
-        
+        UserView: Immutable snapshot of the existing or newly created user
+
     Raises:
-        HTTPException: 404 if user not found
+        UserNotFoundError: If the user cannot be loaded or created
     """
-    logger.info(f"Getting profile for user: {user_id}")
-    
-    # Get or create user (in case they haven't made any queries yet)
-    user = user_service.get_or_create_user(session, user_id)
-    
-    if not user:
-        raise UserNotFoundError("User not found")
-    
+    user = getattr(request.state, "current_user", None)
+    if user is None:
+        user = user_service.get_user_view(session, user_id)
+        if not user:
+            raise UserNotFoundError("User not found")
+        request.state.current_user = user
+    return user
+
+
+# Dependency alias for the request-scoped current user
+CurrentUserDep = Depends(_load_current_user)
+
+# Claims a session token must carry for profile reads to skip the DB;
+# tokens minted before these were serialized fall back to the user lookup
+_PROFILE_CLAIMS = ("user_db_id", "subscription_tier", "created_at", "is_active")
+
+
+def _has_profile_claims(payload: Dict[str, Any]) -> bool:
+    """Check whether a session payload can answer profile reads by itself."""
+    return all(payload.get(claim) is not None for claim in _PROFILE_CLAIMS)
+
+
+def _build_profile(user: UserView) -> UserProfile:
+    """Build the profile response model from a user view."""
     return UserProfile(
         id=user.id,
         email=user.email,
@@ -72,79 +95,154 @@ async def get_current_user_profile(session: SessionDep, user_id: str = Depends(g
     )
 
 
+def _build_usage(user: UserView) -> UserUsage:
+    """Build the usage response model from a user view."""
+    remaining_queries = max(0, user.queries_limit - user.queries_used)
+    return UserUsage(
+        queries_used=user.queries_used,
+        queries_limit=user.queries_limit,
+        remaining_queries=remaining_queries,
+        subscription_tier=user.subscription_tier,
+        can_make_query=user_service.check_query_limit(user)
+    )
+
+
+@router.get("/me", response_model=UserProfile)
+def get_current_user_profile(
+    session: SessionDep,
+    payload: Dict[str, Any] = Depends(get_session_payload)
+):
+    """
+    Get Current User Profile (Session Cookie Auth)
+
+    Returns the authenticated user's profile information including
+    email, subscription tier, account status, and creation date.
+    Answered straight from the session token claims when present,
+    skipping the database entirely.
+
+    Args:
+        session: Database session (fallback lookup for legacy tokens)
+        payload: Verified session token payload
+
+    Returns:
+        UserProfile: User profile information
+
+    Raises:
+        HTTPException: 404 if user not found
+    """
+    logger.info(f"Getting profile for user: {payload['user_id']}")
+
+    if _has_profile_claims(payload):
+        return UserProfile(
+            id=int(payload["user_db_id"]),
+            email=payload["email"],
+            google_id=payload.get("google_id"),
+            subscription_tier=payload["subscription_tier"],
+            is_active=payload["is_active"],
+            created_at=payload["created_at"]
+        )
+
+    # Legacy token without the serialized claims: fall back to the lookup
+    user = user_service.get_user_view(session, payload["user_id"])
+    if not user:
+        raise UserNotFoundError("User not found")
+    return _build_profile(user)
+
+
 @router.get("/me/usage", response_model=UserUsage)
-async def get_current_user_usage(session: SessionDep, user_id: str = Depends(get_session_user)):
+def get_current_user_usage(user: UserView = CurrentUserDep):
     """
     Get Current User Usage Statistics
-    
+
     Returns the authenticated user's query usage information including
     queries used, query limits, and remaining queries.
-    
+
     Args:
-        session: Database session  
-        user_id: Authenticated user ID from session cookie
-        
+        user: Authenticated user loaded once per request
+
     Returns:
         UserUsage: User usage statistics
-        
+
     Raises:
         HTTPException: 404 if user not found
     """
-    logger.info(f"Getting usage stats for user: {user_id}")
-    
-    # Get or create user (in case they haven't made any queries yet)
-    user = user_service.get_or_create_user(session, user_id)
-    
-    if not user:
-        raise UserNotFoundError("User not found")
-    
-    remaining_queries = max(0, user.queries_limit - user.queries_used)
-    
-    return UserUsage(
-        queries_used=user.queries_used,
-        queries_limit=user.queries_limit,
-        remaining_queries=remaining_queries,
-        subscription_tier=user.subscription_tier,
-        can_make_query=user_service.check_query_limit(user)
-    )
+    logger.info(f"Getting usage stats for user: {user.email}")
+    return _build_usage(user)
+
+
+@router.get("/me/summary", response_model=UserSummary)
+def get_current_user_summary(user: UserView = CurrentUserDep):
+    """
+    Get Current User Profile and Usage in One Round-Trip
+
+    Combined endpoint so frontends that need both profile and usage on
+    page load make one request (and one DB lookup) instead of two.
+
+    Args:
+        user: Authenticated user loaded once per request
+
+    Returns:
+        UserSummary: Profile and usage statistics
+
+    Raises:
+        HTTPException: 404 if user not found
+    """
+    logger.info(f"Getting summary for user: {user.email}")
+    return UserSummary(profile=_build_profile(user), usage=_build_usage(user))
 
 
 @router.get("/profile", response_model=UserProfileResponse)
-async def get_user_profile_for_frontend(session: SessionDep, user_id: str = Depends(get_session_user)):
+def get_user_profile_for_frontend(
+    session: SessionDep,
+    payload: Dict[str, Any] = Depends(get_session_payload)
+):
     """
     Get User Profile for Frontend
-    
+
     Returns user profile in format expected by frontend auth service.
     This endpoint matches the frontend's API call to /users/profile.
-    
+    Answered straight from the session token claims when present,
+    skipping the database entirely.
+
     Args:
-        session: Database session
-        user_id: Authenticated user ID from Google ID token
-        
+        session: Database session (fallback lookup for legacy tokens)
+        payload: Verified session token payload
+
     Returns:
         UserProfileResponse: User profile wrapped in expected format
-        
+
     Raises:
         HTTPException: 404 if user not found
     """
-    logger.info(f"Getting frontend profile for user: {user_id}")
-    
-    # Get or create user (in case they haven't made any queries yet)
-    user = user_service.get_or_create_user(session, user_id)
-    
+    logger.info(f"Getting frontend profile for user: {payload['user_id']}")
+
+    if _has_profile_claims(payload):
+        frontend_user = FrontendUserResponse(
+            id=str(payload["user_db_id"]),
+            email=payload["email"],
+            name=payload.get("name"),
+            picture=payload.get("picture"),
+            role="USER",
+            subscription_tier=payload["subscription_tier"],
+            created_at=payload["created_at"],
+            is_active=payload["is_active"]
+        )
+        return UserProfileResponse(user=frontend_user)
+
+    # Legacy token without the serialized claims: fall back to the lookup
+    user = user_service.get_user_view(session, payload["user_id"])
     if not user:
         raise UserNotFoundError("User not found")
-    
-    # Build response matching frontend expectations
+
     frontend_user = FrontendUserResponse(
         id=str(user.id),
         email=user.email,
-        name=None,  # We don't store name in the User model currently
-        picture=None,  # We don't store picture in the User model currently
+        name=payload.get("name"),
+        picture=payload.get("picture"),
         role="USER",
         subscription_tier=user.subscription_tier,
         created_at=user.created_at.isoformat(),
         is_active=user.is_active
     )
-    
+
     return UserProfileResponse(user=frontend_user)
@@ -52,6 +52,14 @@ class Settings:
         
         # Database Configuration
         self.database_url = os.getenv("DATABASE_URL", "sqlite:///./coingrok.db")
+
+        # Connection pool sizing (applies to server databases, ignored for SQLite).
+        # Defaults sized for ~20 concurrent auth requests per worker, each
+        # holding a connection for a couple of queries.
+        self.db_pool_size = self._parse_int("DB_POOL_SIZE", "20")
+        self.db_max_overflow = self._parse_int("DB_MAX_OVERFLOW", "10")
+        self.db_pool_timeout = self._parse_int("DB_POOL_TIMEOUT", "5")
+        self.db_pool_recycle = self._parse_int("DB_POOL_RECYCLE", "1800")
         
         # CORS Configuration
         cors_origins_str = os.getenv("CORS_ORIGINS")
@@ -225,6 +233,12 @@ class Settings:
         if not (1 <= self.http_max_keepalive <= 10000):
             errors.append(f"HTTP_MAX_KEEPALIVE must be 1-10000, got: {self.http_max_keepalive}")
         
+        if not (1 <= self.db_pool_size <= 100):
+            errors.append(f"DB_POOL_SIZE must be 1-100, got: {self.db_pool_size}")
+
+        if not (0 <= self.db_max_overflow <= 100):
+            errors.append(f"DB_MAX_OVERFLOW must be 0-100, got: {self.db_max_overflow}")
+
         if not (1 <= self.rate_limit_per_min <= 10000):
             errors.append(f"RATE_LIMIT_PER_MIN must be 1-10000, got: {self.rate_limit_per_min}")
         
@@ -339,6 +353,23 @@ class Settings:
         if self.database_url.startswith("sqlite"):
             return {"check_same_thread": False}
         return {}
+
+    @property
+    def engine_pool_args(self) -> dict:
+        """Get connection pool arguments based on database type.
+
+        SQLite uses its own pooling behavior, so pool sizing only applies
+        to server databases (PostgreSQL, MySQL).
+        """
+        if self.is_sqlite:
+            return {}
+        return {
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": True,
+        }
     
     @property
     def is_sqlite(self) -> bool:
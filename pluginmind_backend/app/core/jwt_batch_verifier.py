@@ -0,0 +1,139 @@
+"""
+Batched JWT verification for burst login traffic.
+
+Groups session tokens that are already waiting in the queue and verifies
+them together on a worker thread, so a burst of authenticated requests
+performs its HMAC work off the event loop in a handful of executor hops
+instead of one dispatch per request. A lone request is dispatched
+immediately — batching is opportunistic, never waited for — and requests
+whose payload is already cached skip the queue entirely.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Union
+
+from app.core.session import get_cached_payload, verify_session_token
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Never let a single batch grow past this size; larger bursts are split
+# across consecutive executor dispatches.
+BATCH_MAX_SIZE = 32
+
+# Small dedicated pool; verification is short-lived CPU work, so a couple of
+# threads keep up without competing with FastAPI's request threadpool.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jwt-verify")
+
+
+def _verify_batch(tokens: List[str]) -> List[Union[Dict[str, Any], Exception]]:
+    """Verify a batch of tokens on a worker thread.
+
+    Exceptions are returned in-place rather than raised so one bad token
+    cannot fail the rest of the batch.
+    """
+    results: List[Union[Dict[str, Any], Exception]] = []
+    for token in tokens:
+        try:
+            results.append(verify_session_token(token))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+class _BatchVerifier:
+    """Queues incoming tokens and verifies them in opportunistic batches."""
+
+    def __init__(self) -> None:
+        self._queue: "asyncio.Queue" = None
+        self._worker: "asyncio.Task" = None
+        self._loop: "asyncio.AbstractEventLoop" = None
+
+    def _ensure_worker(self) -> None:
+        """Lazily bind the queue and drain task to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use on this loop (or the loop changed, e.g. across test
+            # clients): rebuild the queue and restart the drain task. Any
+            # tokens still queued from the previous loop would never be
+            # drained, so fail their futures over instead of leaving the
+            # callers awaiting forever.
+            if self._queue is not None:
+                while not self._queue.empty():
+                    _, future = self._queue.get_nowait()
+                    if not future.done():
+                        try:
+                            future.set_exception(RuntimeError(
+                                "JWT verifier rebound to a new event loop"
+                            ))
+                        except Exception:
+                            # The future's loop may already be closed
+                            pass
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._drain())
+            self._loop = loop
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """Queue a token for batched verification and await its payload."""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._queue.put_nowait((token, future))
+        return await future
+
+    async def _drain(self) -> None:
+        """Drain the queue, dispatching batches to the verifier pool.
+
+        Dispatches immediately with whatever is already queued: a burst
+        that enqueued several tokens in the same loop iteration (or while
+        the previous batch was verifying) is grouped, while a lone token
+        never waits on a batching window.
+        """
+        while True:
+            # Block until at least one token arrives, then sweep up any
+            # others already waiting without yielding to the loop.
+            batch = [await self._queue.get()]
+            while len(batch) < BATCH_MAX_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            tokens = [token for token, _ in batch]
+            try:
+                results = await self._loop.run_in_executor(_executor, _verify_batch, tokens)
+            except Exception as exc:
+                logger.error(f"Batch JWT verification dispatch failed: {str(exc)}")
+                results = [exc] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+# Shared verifier instance; state is created lazily on the running loop
+_verifier = _BatchVerifier()
+
+
+async def verify_async(token: str) -> Dict[str, Any]:
+    """
+    Verify a session token, serving cached payloads synchronously.
+
+    The payload cache is consulted before anything is enqueued, so the
+    common case — a recently verified token — costs a dict lookup instead
+    of a queue round-trip and executor hop.
+
+    Args:
+        token: JWT session token string
+
+    Returns:
+        Dict[str, Any]: Token payload with user information
+
+    Raises:
+        HTTPException: 401 if token is invalid, expired, or malformed
+    """
+    payload = get_cached_payload(token)
+    if payload is not None:
+        return payload
+    return await _verifier.verify(token)
@@ -5,8 +5,18 @@ Provides secure session token creation and validation using HS256 algorithm,
 separate from Google OAuth tokens for proper session lifecycle management.
 """
 
+import base64
+import binascii
+import hashlib
+import threading
+import time
+
 import jwt
-from datetime import datetime, timedelta, timezone
+import orjson
+from cachetools import TTLCache
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hmac as crypto_hmac
 from typing import Dict, Any, Optional
 from fastapi import HTTPException
 
@@ -18,8 +28,71 @@ logger = get_logger(__name__)
 # Session token settings
 SESSION_ALGORITHM = "HS256"
 SESSION_EXPIRY_HOURS = 24
+_EXPIRY_SECONDS = SESSION_EXPIRY_HOURS * 3600
 COOKIE_NAME = "pm_session"
 
+# Dedicated PyJWT instance and signing key, resolved once at import time so
+# the hot encode/decode paths skip the module-level helper indirection and
+# the per-call settings attribute lookup.
+_JWT = jwt.PyJWT()
+_SESSION_SECRET = settings.backend_session_secret
+_SESSION_SECRET_BYTES = _SESSION_SECRET.encode() if _SESSION_SECRET else b""
+
+# Every token we mint carries the exact header PyJWT produces for HS256, so
+# the verification fast path can match the encoded segment directly instead
+# of parsing it. Tokens with any other header fall back to the full PyJWT
+# decode (which rejects alg confusion attempts like "none").
+_EXPECTED_HEADER_B64 = _JWT.encode(
+    {}, _SESSION_SECRET or "unused", algorithm=SESSION_ALGORITHM
+).split(".")[0]
+
+# Decode arguments for the PyJWT fallback path, built once instead of being
+# reassembled per call. require rejects tokens missing the core claims with
+# an explicit leeway of 0 so PyJWT skips its leeway branch.
+_DECODE_KWARGS = {
+    "algorithms": [SESSION_ALGORITHM],
+    "audience": "pluginmind-frontend",
+    "issuer": "pluginmind-backend",
+    "leeway": 0,
+    "options": {"require": ["exp", "iat", "user_id", "email"]},
+}
+
+# Cache of verified token payloads, keyed by a token digest so raw tokens
+# never sit in memory. Entries expire after a short TTL so revocations and
+# claim changes propagate quickly; token expiry is still enforced on hit.
+_PAYLOAD_CACHE_TTL_SECONDS = 60
+_payload_cache: TTLCache = TTLCache(maxsize=10000, ttl=_PAYLOAD_CACHE_TTL_SECONDS)
+_payload_cache_lock = threading.Lock()
+
+
+def _payload_cache_key(token: str) -> str:
+    """Derive the payload-cache key from a session token."""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def get_cached_payload(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Return a token's cached payload without re-verifying it, or None.
+
+    A hit means the token was fully verified within the cache TTL; expiry
+    is re-checked so a cached entry can never outlive the token itself.
+    Lets async callers serve the hot path synchronously before paying for
+    an executor or queue hop.
+
+    Args:
+        token: JWT session token string
+
+    Returns:
+        Optional[Dict[str, Any]]: Cached payload, or None on miss/expiry
+    """
+    if not token:
+        return None
+    with _payload_cache_lock:
+        payload = _payload_cache.get(_payload_cache_key(token))
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+    return None
+
 
 def create_session_token(user_id: str, email: str, additional_claims: Optional[Dict[str, Any]] = None) -> str:
     """
@@ -36,15 +109,16 @@ def create_session_token(user_id: str, email: str, additional_claims: Optional[D
     Raises:
         Exception: If token creation fails
     """
-    now = datetime.now(timezone.utc)
-    expiry = now + timedelta(hours=SESSION_EXPIRY_HOURS)
-    
+    # Unix timestamps go straight into the claims: PyJWT accepts numeric
+    # iat/exp, skipping the datetime-to-timestamp conversion per token
+    now_ts = int(time.time())
+
     # Base claims
     payload = {
         "user_id": user_id,
         "email": email,
-        "iat": now,
-        "exp": expiry,
+        "iat": now_ts,
+        "exp": now_ts + _EXPIRY_SECONDS,
         "iss": "pluginmind-backend",
         "aud": "pluginmind-frontend"
     }
@@ -54,9 +128,9 @@ def create_session_token(user_id: str, email: str, additional_claims: Optional[D
         payload.update(additional_claims)
     
     try:
-        token = jwt.encode(
-            payload, 
-            settings.backend_session_secret, 
+        token = _JWT.encode(
+            payload,
+            _SESSION_SECRET,
             algorithm=SESSION_ALGORITHM
         )
         
@@ -68,6 +142,70 @@ def create_session_token(user_id: str, email: str, additional_claims: Optional[D
         raise HTTPException(status_code=500, detail="Failed to create session token")
 
 
+def _b64url_decode(segment: str) -> bytes:
+    """Base64url-decode a JWT segment, restoring stripped padding."""
+    try:
+        return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+    except (binascii.Error, ValueError):
+        raise jwt.DecodeError("Invalid base64-encoded segment")
+
+
+def _decode_hs256_fast(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Verify an HS256 session token directly against OpenSSL's HMAC.
+
+    Skips PyJWT's per-call setup by HMAC-ing the signing input with a
+    cryptography-backed SHA-256 and validating the standard claims inline.
+    Returns None for tokens whose header differs from the one we mint, so
+    callers can fall back to the full PyJWT decode.
+
+    Raises:
+        jwt.InvalidTokenError: (or a subclass) mirroring PyJWT's behavior
+            for bad signatures, expired tokens, and claim mismatches
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+    except ValueError:
+        raise jwt.DecodeError("Not enough segments")
+
+    if header_b64 != _EXPECTED_HEADER_B64:
+        # Foreign or non-standard header: let PyJWT handle (and reject) it
+        return None
+
+    signing_input = f"{header_b64}.{payload_b64}".encode()
+    signature = _b64url_decode(signature_b64)
+
+    hmac_ctx = crypto_hmac.HMAC(_SESSION_SECRET_BYTES, hashes.SHA256())
+    hmac_ctx.update(signing_input)
+    try:
+        hmac_ctx.verify(signature)
+    except InvalidSignature:
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except ValueError:
+        raise jwt.DecodeError("Invalid payload string")
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+
+    # Validate registered claims the same way jwt.decode would
+    now = time.time()
+    exp = payload.get("exp")
+    if exp is None:
+        raise jwt.MissingRequiredClaimError("exp")
+    if int(exp) <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    if payload.get("aud") != "pluginmind-frontend":
+        raise jwt.InvalidAudienceError("Audience doesn't match")
+
+    if payload.get("iss") != "pluginmind-backend":
+        raise jwt.InvalidIssuerError("Invalid issuer")
+
+    return payload
+
+
 def verify_session_token(token: str) -> Dict[str, Any]:
     """
     Verify and decode a backend session token.
@@ -83,24 +221,33 @@ def verify_session_token(token: str) -> Dict[str, Any]:
     """
     if not token:
         raise HTTPException(status_code=401, detail="Session token is required")
-    
+
+    # Serve recently verified tokens from the cache, skipping the HMAC
+    # verification and JSON parse
+    cached_payload = get_cached_payload(token)
+    if cached_payload is not None:
+        return cached_payload
+
     try:
-        # Decode and verify the token
-        payload = jwt.decode(
-            token,
-            settings.backend_session_secret,
-            algorithms=[SESSION_ALGORITHM],
-            audience="pluginmind-frontend",
-            issuer="pluginmind-backend"
-        )
-        
+        # Decode and verify the token: direct HMAC fast path for our own
+        # HS256 tokens, full PyJWT decode for anything else
+        payload = _decode_hs256_fast(token)
+        if payload is None:
+            payload = _JWT.decode(token, _SESSION_SECRET, **_DECODE_KWARGS)
+
         # Validate required claims
         user_id = payload.get("user_id")
         email = payload.get("email")
         
         if not user_id or not email:
             raise HTTPException(status_code=401, detail="Invalid session token: missing required claims")
-        
+
+        # Cache the verified payload, but never beyond the token's own expiry
+        remaining = payload.get("exp", 0) - time.time()
+        if remaining > 0:
+            with _payload_cache_lock:
+                _payload_cache[_payload_cache_key(token)] = payload
+
         logger.debug(f"Verified session token for user: {email}")
         return payload
         
@@ -115,23 +262,31 @@ def verify_session_token(token: str) -> Dict[str, Any]:
         raise HTTPException(status_code=401, detail="Session verification failed")
 
 
-def get_cookie_settings(secure: bool = False) -> Dict[str, Any]:
+def invalidate_session(token: str) -> None:
     """
-    Get session cookie settings based on environment.
-    
+    Remove a session token's cached payload.
+
+    Called on logout so a cached verification result cannot outlive
+    the session cookie it was derived from.
+
     Args:
-        secure: Whether to set Secure flag (for HTTPS/production)
-        
-    Returns:
-        Dict[str, Any]: Cookie settings for FastAPI Response.set_cookie()
+        token: JWT session token string to invalidate
     """
+    if not token:
+        return
+    with _payload_cache_lock:
+        _payload_cache.pop(_payload_cache_key(token), None)
+
+
+def _build_cookie_settings(secure: bool) -> Dict[str, Any]:
+    """Build session cookie settings for FastAPI Response.set_cookie()."""
     settings_dict = {
         "key": COOKIE_NAME,
         "httponly": True,
         "samesite": "lax",
         "secure": secure,
         "path": "/",
-        "max_age": SESSION_EXPIRY_HOURS * 3600  # Convert hours to seconds
+        "max_age": _EXPIRY_SECONDS
     }
     # Optionally set cookie domain for cross-subdomain deployments
     if getattr(settings, "session_cookie_domain", None):
@@ -139,13 +294,8 @@ def get_cookie_settings(secure: bool = False) -> Dict[str, Any]:
     return settings_dict
 
 
-def get_logout_cookie_settings() -> Dict[str, Any]:
-    """
-    Get cookie settings for logout (clear session cookie).
-    
-    Returns:
-        Dict[str, Any]: Cookie settings to clear session cookie
-    """
+def _build_logout_cookie_settings() -> Dict[str, Any]:
+    """Build cookie settings that clear the session cookie."""
     settings_dict = {
         "key": COOKIE_NAME,
         "value": "",
@@ -158,3 +308,34 @@ def get_logout_cookie_settings() -> Dict[str, Any]:
     if getattr(settings, "session_cookie_domain", None):
         settings_dict["domain"] = settings.session_cookie_domain
     return settings_dict
+
+
+# Cookie settings are environment-static, so build them once at import time
+# instead of reassembling the dicts on every request. Callers must treat the
+# returned dicts as read-only (set_cookie only reads them as kwargs).
+_COOKIE_SETTINGS_SECURE = _build_cookie_settings(secure=True)
+_COOKIE_SETTINGS_INSECURE = _build_cookie_settings(secure=False)
+_LOGOUT_COOKIE_SETTINGS = _build_logout_cookie_settings()
+
+
+def get_cookie_settings(secure: bool = False) -> Dict[str, Any]:
+    """
+    Get session cookie settings based on environment.
+
+    Args:
+        secure: Whether to set Secure flag (for HTTPS/production)
+
+    Returns:
+        Dict[str, Any]: Cookie settings for FastAPI Response.set_cookie()
+    """
+    return _COOKIE_SETTINGS_SECURE if secure else _COOKIE_SETTINGS_INSECURE
+
+
+def get_logout_cookie_settings() -> Dict[str, Any]:
+    """
+    Get cookie settings for logout (clear session cookie).
+
+    Returns:
+        Dict[str, Any]: Cookie settings to clear session cookie
+    """
+    return _LOGOUT_COOKIE_SETTINGS
@@ -16,6 +16,7 @@ engine = create_engine(
     settings.database_url,
     connect_args=settings.connect_args,
     echo=settings.debug,  # Log SQL queries in debug mode
+    **settings.engine_pool_args,  # Pool sizing for server databases
 )
 
 
@@ -48,5 +49,9 @@ def get_session():
     Yields:
         Session: SQLModel database session
     """
-    with Session(engine) as session:
+    # expire_on_commit=False keeps loaded attributes usable after commit
+    # instead of expiring them, so reads like user.subscription_tier after
+    # a commit don't silently issue a refresh SELECT. Code that needs fresh
+    # DB state after commit already calls session.refresh() explicitly.
+    with Session(engine, expire_on_commit=False) as session:
         yield session
\ No newline at end of file
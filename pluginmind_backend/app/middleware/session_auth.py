@@ -6,15 +6,14 @@ replacing Google ID token dependencies for better session lifecycle management.
 """
 
 from typing import Optional, Dict, Any
-from fastapi import Request, HTTPException, Depends, Cookie
-from app.core.session import verify_session_token
+from fastapi import HTTPException, Depends, Cookie
+from app.core.jwt_batch_verifier import verify_async
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def get_session_user(
-    request: Request,
+async def get_session_user(
     pm_session: Optional[str] = Cookie(None)
 ) -> str:
     """
@@ -23,7 +22,6 @@ def get_session_user(
     Reads and verifies the pm_session cookie from the request.
     
     Args:
-        request: FastAPI request object
         pm_session: Session cookie value (automatically injected by FastAPI)
         
     Returns:
@@ -41,7 +39,7 @@ def get_session_user(
     
     try:
         # Verify session token and extract user info
-        payload = verify_session_token(pm_session)
+        payload = await verify_async(pm_session)
         user_id = payload["user_id"]
         email = payload.get("email", "unknown")
         
@@ -56,8 +54,7 @@ def get_session_user(
         raise HTTPException(status_code=401, detail="Session authentication failed")
 
 
-def get_session_user_optional(
-    request: Request,
+async def get_session_user_optional(
     pm_session: Optional[str] = Cookie(None)
 ) -> Optional[str]:
     """
@@ -66,7 +63,6 @@ def get_session_user_optional(
     Returns None if no session cookie is provided, otherwise verifies the session.
     
     Args:
-        request: FastAPI request object
         pm_session: Session cookie value (automatically injected by FastAPI)
         
     Returns:
@@ -81,7 +77,7 @@ def get_session_user_optional(
     
     try:
         # Verify session token and extract user info
-        payload = verify_session_token(pm_session)
+        payload = await verify_async(pm_session)
         user_id = payload["user_id"]
         email = payload.get("email", "unknown")
         
@@ -96,8 +92,7 @@ def get_session_user_optional(
         raise HTTPException(status_code=401, detail="Session authentication failed")
 
 
-def get_session_payload(
-    request: Request,
+async def get_session_payload(
     pm_session: Optional[str] = Cookie(None)
 ) -> Dict[str, Any]:
     """
@@ -106,7 +101,6 @@ def get_session_payload(
     Useful when you need access to additional claims in the session token.
     
     Args:
-        request: FastAPI request object
         pm_session: Session cookie value (automatically injected by FastAPI)
         
     Returns:
@@ -124,7 +118,7 @@ def get_session_payload(
     
     try:
         # Verify session token and return full payload
-        payload = verify_session_token(pm_session)
+        payload = await verify_async(pm_session)
         email = payload.get("email", "unknown")
         
         logger.debug(f"Session payload access for user: {email}")
@@ -78,7 +78,7 @@ class User(SQLModel, table=True):
     queries_limit: int = Field(default=10, description="Monthly query limit based on tier")
     
     # Authentication integration (OAuth)
-    google_id: Optional[str] = Field(None, unique=True, description="Google OAuth user ID")
+    google_id: Optional[str] = Field(None, unique=True, index=True, description="Google OAuth user ID")
     is_active: bool = Field(default=True, description="Account active status")
 
 
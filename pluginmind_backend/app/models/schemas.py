@@ -7,7 +7,7 @@ serialization, and documentation.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 from pydantic import BaseModel, Field, field_validator
 
 from app.core.config import settings
@@ -92,7 +92,9 @@ class GenericAnalysisResponse(BaseModel):
     """Response model for generic analysis results with enhanced metadata."""
     analysis_type: AnalysisType = Field(description="Type of analysis performed")
     optimized_prompt: str = Field(description="AI-optimized prompt")
-    analysis_result: str = Field(description="Final analysis result")
+    analysis_result: Union[str, dict] = Field(
+        description="Final analysis result, as a JSON string or pre-parsed object"
+    )
     system_prompt: str = Field(description="System prompt template used")
     services_used: dict = Field(description="AI services used in the analysis pipeline")
     metadata: dict = Field(default_factory=dict, description="Additional analysis metadata")
@@ -140,6 +142,12 @@ class UserUsage(BaseModel):
     can_make_query: bool = Field(description="Whether user can make another query")
 
 
+class UserSummary(BaseModel):
+    """Response model combining profile and usage in a single round-trip."""
+    profile: UserProfile = Field(description="User profile information")
+    usage: UserUsage = Field(description="User usage statistics")
+
+
 class ErrorDetail(BaseModel):
     """Error detail information."""
     message: str = Field(description="User-friendly error message")
@@ -5,13 +5,32 @@ Handles user creation, lookup, and profile management for Google OAuth users
 via Supabase integration.
 """
 
+import threading
+from collections import namedtuple
 from typing import Optional
+
+from cachetools import TTLCache
 from sqlmodel import Session, select
 from app.models.database import User
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Immutable snapshot of a user row for read-mostly endpoints. Cached instead
+# of the ORM instance so a cached entry can never leak session state or be
+# mutated by a caller.
+UserView = namedtuple(
+    "UserView",
+    ["id", "email", "google_id", "subscription_tier", "queries_used",
+     "queries_limit", "is_active", "created_at"]
+)
+
+# Short TTL keeps repeat profile/usage reads for an active session off the
+# database while bounding staleness; writes invalidate their entries eagerly.
+_USER_VIEW_TTL_SECONDS = 30
+_user_view_cache: TTLCache = TTLCache(maxsize=5000, ttl=_USER_VIEW_TTL_SECONDS)
+_user_view_lock = threading.Lock()
+
 
 class UserService:
     """
@@ -61,6 +80,7 @@ class UserService:
                     session.add(user)
                     session.commit()
                     session.refresh(user)
+                    self.invalidate_user_view(user)
                     logger.info(f"Updated existing user with google_id: {email}")
                 
                 return user
@@ -82,6 +102,63 @@ class UserService:
         logger.info(f"Created new user: {new_user.email} (google_id: {user_id})")
         return new_user
     
+    def get_user_view(
+        self,
+        session: Session,
+        user_id: str,
+        email: Optional[str] = None
+    ) -> UserView:
+        """
+        Get a cached, immutable view of a user for read-only endpoints.
+
+        Serves repeat profile/usage reads from an in-process TTL cache,
+        falling back to get_or_create_user on a miss. Entries are dropped
+        on any write (see invalidate_user_view), so staleness is bounded
+        by the cache TTL even without a write in between.
+
+        Args:
+            session: Database session (used only on cache miss)
+            user_id: User identifier from JWT token
+            email: User email from JWT token (optional fallback)
+
+        Returns:
+            UserView: Immutable snapshot of the user row
+        """
+        with _user_view_lock:
+            view = _user_view_cache.get(user_id)
+        if view is not None:
+            return view
+
+        user = self.get_or_create_user(session, user_id, email)
+        view = UserView(
+            id=user.id,
+            email=user.email,
+            google_id=user.google_id,
+            subscription_tier=user.subscription_tier,
+            queries_used=user.queries_used,
+            queries_limit=user.queries_limit,
+            is_active=user.is_active,
+            created_at=user.created_at
+        )
+        with _user_view_lock:
+            _user_view_cache[user_id] = view
+        return view
+
+    def invalidate_user_view(self, user: User) -> None:
+        """
+        Drop a user's cached view after a write.
+
+        Both identifiers are evicted since callers key the cache by
+        whichever one their session token carries.
+
+        Args:
+            user: User model whose cached views should be dropped
+        """
+        with _user_view_lock:
+            _user_view_cache.pop(user.email, None)
+            if user.google_id:
+                _user_view_cache.pop(user.google_id, None)
+
     def get_user_by_id(self, session: Session, user_id: str) -> Optional[User]:
         """
         Get user by google_id.
@@ -111,7 +188,10 @@ class UserService:
         session.add(user)
         session.commit()
         session.refresh(user)
-        
+
+        # Drop any cached view so usage reads see the new count
+        self.invalidate_user_view(user)
+
         logger.debug(f"Incremented queries for user {user.email}: {user.queries_used}/{user.queries_limit}")
         return user
     
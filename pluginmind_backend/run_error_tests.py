@@ -6,11 +6,12 @@ This script specifically runs error-related tests to validate the error handling
 and integration components of the PluginMind backend.
 """
 
-import subprocess
 import sys
 import os
 from pathlib import Path
 
+import pytest
+
 
 def main():
     """Run error-related tests with proper configuration."""
@@ -38,44 +39,33 @@ def main():
         print(f"❌ Missing test files: {', '.join(missing_files)}")
         sys.exit(1)
 
-    # Run each error test file with verbose output
-    failed_tests = []
-
-    for test_file in error_test_files:
-        print(f"\n🔍 Running {test_file}...")
-        print("-" * 40)
-
-        try:
-            # Run pytest with specific test file
-            result = subprocess.run([
-                sys.executable, "-m", "pytest",
-                test_file,
-                "-v",  # verbose
-                "--tb=short",  # short traceback format
-                "--no-header",  # cleaner output
-                "--disable-warnings"  # reduce noise
-            ], check=False, capture_output=False)
-
-            if result.returncode != 0:
-                failed_tests.append(test_file)
-                print(f"❌ {test_file} failed with exit code {result.returncode}")
-            else:
-                print(f"✅ {test_file} passed")
-
-        except Exception as e:
-            print(f"❌ Error running {test_file}: {e}")
-            failed_tests.append(test_file)
+    # Run all error test files in one in-process pytest invocation, skipping
+    # a fresh interpreter start and app-stack re-import per file. Workers are
+    # still parallelized with pytest-xdist (--dist=loadfile keeps each file's
+    # tests on one worker so module-level fixtures aren't duplicated mid-file)
+    print(f"\n🔍 Running {', '.join(error_test_files)}...")
+    print("-" * 40)
+
+    try:
+        exit_code = pytest.main([
+            *error_test_files,
+            "-n", "auto",  # parallel workers (pytest-xdist)
+            "--dist=loadfile",  # distribute whole files to workers
+            "-v",  # verbose
+            "--tb=short",  # short traceback format
+            "--disable-warnings"  # reduce noise
+        ])
+    except Exception as e:
+        print(f"❌ Error running error tests: {e}")
+        exit_code = 1
 
     # Summary
     print("\n" + "=" * 50)
     print("🚨 Error Test Summary")
     print("=" * 50)
 
-    if failed_tests:
-        print(f"❌ Failed tests: {len(failed_tests)}")
-        for test in failed_tests:
-            print(f"   - {test}")
-        print(f"✅ Passed tests: {len(error_test_files) - len(failed_tests)}")
+    if exit_code != 0:
+        print(f"❌ Error tests failed with exit code {exit_code}")
         sys.exit(1)
     else:
         print(f"✅ All error tests passed! ({len(error_test_files)} test files)")
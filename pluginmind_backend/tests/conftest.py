@@ -35,6 +35,41 @@ test_env_vars = {
 for key, value in test_env_vars.items():
     os.environ.setdefault(key, value)
 
+# Skip Pydantic response validation in routes that support it; the mocks in
+# these tests already return response-shaped data, so validating it again on
+# the way out is pure overhead. Must be set before app modules are imported.
+os.environ.setdefault("PLUGINMIND_SKIP_RESPONSE_VALIDATION", "1")
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    Run async tests on uvloop where available.
+
+    uvloop's libuv-backed loop is markedly faster than stdlib asyncio for
+    the request/response cycles the async test clients drive; on platforms
+    without uvloop (e.g. Windows) the default policy is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        import asyncio
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def asgi_app():
+    """
+    Session-scoped FastAPI application instance.
+
+    Importing app.main is deferred into the fixture so the (expensive)
+    application import happens at most once per session, and only after
+    the test environment above is in place.
+    """
+    from app.main import app
+    return app
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """
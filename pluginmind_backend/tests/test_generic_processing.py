@@ -3,196 +3,224 @@ Test suite for generic AI processing endpoints.
 
 Tests the new /process endpoint and generic analysis functionality
 introduced in the PluginMind transformation.
+
+The tests are independent and safe under pytest-xdist with per-file
+distribution (pytest -n auto --dist=loadfile): each worker builds its own
+client fixture and session token, and no mutable state is shared across
+workers beyond the sqlite test database, which loadfile keeps per-worker.
 """
 
-import json
+import httpx
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock, AsyncMock
-
-from app.main import app
+import pytest_asyncio
 from app.ash_prompt import AnalysisType
-from app.core.session import create_session_token, COOKIE_NAME
+from app.services.analysis_service import analysis_service
+
+TEST_EMAIL = "test_user@example.com"
+TEST_USER_ID = "test-google-id"
+
+# Every test exercises the ASGI app directly, so they all run on the shared
+# session-scoped event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(asgi_app):
+    """Shared in-memory ASGI client; one transport for the whole session."""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=asgi_app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_cookies(client):
+    """Start every test with an empty cookie jar."""
+    client.cookies.clear()
+    yield
+
+
+# Shared session token, minted once on first use; the claims are identical
+# across tests so there is no point re-signing a JWT per test. The cookie
+# name is stashed alongside it by the lazy import below.
+_SESSION_TOKEN = None
+_COOKIE_NAME = None
+
+
+def _mock_result(analysis_type, result_payload, ai_service):
+    """Build an analyze_generic return value in the shape the service emits."""
+    return {
+        "analysis_type": analysis_type,
+        "optimized_prompt": f"Optimized {analysis_type} prompt",
+        # Kept as a dict: the response schema accepts pre-parsed results, so
+        # the tests skip a serialize/parse round-trip per request
+        "analysis_result": result_payload,
+        "system_prompt": f"{analysis_type} system prompt",
+        "services_used": {"primary": f"openai_{ai_service}", "fallback": None},
+        "metadata": {"ai_service": f"openai_{ai_service}"}
+    }
+
+
+# Mock results are static across tests, so build (and JSON-encode) each of
+# them exactly once at import instead of per test
+_DOCUMENT_RESULT = _mock_result(
+    "document",
+    {"summary": "Test document summary", "key_points": ["Point 1", "Point 2"],
+     "metadata": {"word_count": 100}},
+    "document"
+)
+_CHAT_RESULT = _mock_result(
+    "chat",
+    {"response": "This is a chat response", "context": {"conversation_id": "123"}},
+    "chat"
+)
+_SEO_RESULT = _mock_result(
+    "seo",
+    {"title": "SEO Optimized Title",
+     "meta_description": "Description for search engines",
+     "keywords": ["keyword1", "keyword2"]},
+    "seo"
+)
+_CUSTOM_RESULT = _mock_result(
+    "custom",
+    {"custom_output": "Flexible custom analysis result",
+     "processing_notes": "Used generic analyzer"},
+    "generic"
+)
+_OPTIONS_RESULT = _mock_result("document", {"processed": "with options"}, "document")
+
+_RESULTS = {
+    "document": _DOCUMENT_RESULT,
+    "chat": _CHAT_RESULT,
+    "seo": _SEO_RESULT,
+    "custom": _CUSTOM_RESULT,
+}
+
+# Static request bodies, serialized to bytes once at import; posting them
+# via content= skips httpx's per-request JSON encoding
+_JSON_HEADERS = {"content-type": "application/json"}
+_PROCESS_BODIES = {
+    analysis_type: orjson.dumps({
+        "user_input": f"Run a {analysis_type} analysis",
+        "analysis_type": analysis_type,
+        **({"options": {"temperature": 0.7}} if analysis_type == "custom" else {})
+    })
+    for analysis_type in _RESULTS
+}
+_BARE_BODY = orjson.dumps({"user_input": "test"})
+_DOCUMENT_BODY = _PROCESS_BODIES["document"]
+_OPTIONS_BODY = orjson.dumps({
+    "user_input": "Test with options",
+    "analysis_type": "document",
+    "options": {"max_length": 500, "format": "markdown"}
+})
+_INVALID_TYPE_BODY = orjson.dumps({"user_input": "Test input", "analysis_type": "invalid_type"})
+_MISSING_INPUT_BODY = orjson.dumps({"analysis_type": "document"})
+_ANALYZE_BODY = orjson.dumps({"user_input": "Analyze Bitcoin"})
+
+
+class _Stub:
+    """
+    Minimal async callable standing in for AsyncMock.
+
+    The tests here only ever set a return value and (occasionally) look
+    at call arguments, so a plain object with a list of calls avoids
+    AsyncMock's call-recording and spec machinery on every invocation.
+    """
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+
+@pytest.fixture
+def mock_analyze(monkeypatch):
+    """Patch analyze_generic once per test; tests just set return_value."""
+    stub = _Stub()
+    monkeypatch.setattr(analysis_service, "analyze_generic", stub)
+    return stub
+
+
+@pytest.fixture
+def mock_legacy_analysis(monkeypatch):
+    """Patch the legacy crypto analysis entry point the same way."""
+    stub = _Stub()
+    monkeypatch.setattr(analysis_service, "perform_analysis_with_logging", stub)
+    return stub
+
+
+def _assert_response_shape(data, **expected):
+    """Assert the standard /process response keys plus any expected values."""
+    assert expected.items() <= data.items()
+    assert {"optimized_prompt", "system_prompt",
+            "analysis_result", "services_used"} <= data.keys()
+
+
+def _authenticate(client):
+    """Set a valid session cookie for authenticated requests."""
+    global _SESSION_TOKEN, _COOKIE_NAME
+    if _SESSION_TOKEN is None:
+        # Imported lazily so tests that never authenticate skip loading the
+        # session module and its crypto dependencies
+        from app.core.session import create_session_token, COOKIE_NAME
+        _COOKIE_NAME = COOKIE_NAME
+        _SESSION_TOKEN = create_session_token(
+            user_id=TEST_USER_ID,
+            email=TEST_EMAIL,
+            additional_claims={"user_db_id": TEST_USER_ID}
+        )
+    client.cookies.set(_COOKIE_NAME, _SESSION_TOKEN)
 
 
 class TestGenericProcessingEndpoint:
     """Test the new /process endpoint for generic AI processing."""
-    
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-        self.test_email = "test_user@example.com"
-        self.test_user_id = "test-google-id"
-
-    def _authenticate(self):
-        """Set a valid session cookie for authenticated requests."""
-        token = create_session_token(
-            user_id=self.test_user_id,
-            email=self.test_email,
-            additional_claims={"user_db_id": self.test_user_id}
-        )
-        self.client.cookies.set(COOKIE_NAME, token)
-    
-    def test_process_endpoint_exists(self):
+
+    async def test_process_endpoint_exists(self, client):
         """Test that /process endpoint is registered."""
         # Make a request to the endpoint (will fail auth but proves it exists)
-        response = self.client.post("/process", json={"user_input": "test"})
+        response = await client.post("/process", content=_BARE_BODY, headers=_JSON_HEADERS)
         # Should get 401 (unauthorized) not 404 (not found)
         assert response.status_code in [401, 422]  # 401 for auth, 422 for validation
-    
-    @patch('app.services.analysis_service.analysis_service.analyze_generic')
-    def test_process_document_analysis(self, mock_analyze):
-        """Test document processing through /process endpoint."""
-        # Mock the analysis service response with correct structure
-        mock_analyze.return_value = {
-            "analysis_type": "document",
-            "optimized_prompt": "Optimized document analysis prompt",
-            "analysis_result": '{"summary": "Test document summary", "key_points": ["Point 1", "Point 2"], "metadata": {"word_count": 100}}',
-            "system_prompt": "Document analysis system prompt",
-            "services_used": {"primary": "openai_document", "fallback": None},
-            "metadata": {
-                "processing_time": 1.5,
-                "ai_service": "openai_document"
-            }
-        }
-        
-        self._authenticate()
-
-        response = self.client.post(
-            "/process",
-            json={
-                "user_input": "Analyze this document content",
-                "analysis_type": "document"
-            }
-        )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["analysis_type"] == "document"
+    @pytest.mark.parametrize("analysis_type, payload_keys, ai_service", [
+        ("document", ["summary"], "document"),
+        ("chat", ["response"], "chat"),
+        ("seo", ["title", "keywords"], "seo"),
+        ("custom", ["custom_output"], "generic"),
+    ])
+    async def test_process_analysis(self, mock_analyze, client,
+                                    analysis_type, payload_keys, ai_service):
+        """Test each analysis type through the /process endpoint."""
+        mock_analyze.return_value = _RESULTS[analysis_type]
 
-        # Parse the JSON string result
-        result = json.loads(data["analysis_result"])
-        assert "summary" in result
-        assert result["summary"] == "Test document summary"
+        _authenticate(client)
 
-        assert data["metadata"]["ai_service"] == "openai_document"
-        assert "optimized_prompt" in data
-        assert "system_prompt" in data
-    
-    @patch('app.services.analysis_service.analysis_service.analyze_generic')
-    def test_process_chat_analysis(self, mock_analyze):
-        """Test chat processing through /process endpoint."""
-        mock_analyze.return_value = {
-            "analysis_type": "chat",
-            "optimized_prompt": "Optimized chat prompt",
-            "analysis_result": '{"response": "This is a chat response", "context": {"conversation_id": "123"}}',
-            "system_prompt": "Chat system prompt",
-            "services_used": {"primary": "openai_chat", "fallback": None},
-            "metadata": {
-                "processing_time": 0.8,
-                "ai_service": "openai_chat"
-            }
-        }
-        
-        self._authenticate()
-
-        response = self.client.post(
-            "/process",
-            json={
-                "user_input": "Hello, how are you?",
-                "analysis_type": "chat"
-            }
+        response = await client.post(
+            "/process", content=_PROCESS_BODIES[analysis_type], headers=_JSON_HEADERS
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["analysis_type"] == "chat"
-
-        result = json.loads(data["analysis_result"])
-        assert "response" in result
-        assert "optimized_prompt" in data
-    
-    @patch('app.services.analysis_service.analysis_service.analyze_generic')
-    def test_process_seo_analysis(self, mock_analyze):
-        """Test SEO generation through /process endpoint."""
-        mock_analyze.return_value = {
-            "analysis_type": "seo",
-            "optimized_prompt": "Optimized SEO prompt",
-            "analysis_result": '{"title": "SEO Optimized Title", "meta_description": "Description for search engines", "keywords": ["keyword1", "keyword2"]}',
-            "system_prompt": "SEO system prompt",
-            "services_used": {"primary": "openai_seo", "fallback": None},
-            "metadata": {
-                "processing_time": 1.2,
-                "ai_service": "openai_seo"
-            }
-        }
-        
-        self._authenticate()
-
-        response = self.client.post(
-            "/process",
-            json={
-                "user_input": "Create SEO content for AI platform",
-                "analysis_type": "seo"
-            }
-        )
+        _assert_response_shape(data, analysis_type=analysis_type)
+        assert data["metadata"]["ai_service"] == f"openai_{ai_service}"
+        assert set(payload_keys) <= data["analysis_result"].keys()
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["analysis_type"] == "seo"
-
-        result = json.loads(data["analysis_result"])
-        assert "title" in result
-        assert "keywords" in result
-    
-    @patch('app.services.analysis_service.analysis_service.analyze_generic')
-    def test_process_custom_analysis(self, mock_analyze):
-        """Test custom analysis type through /process endpoint."""
-        mock_analyze.return_value = {
-            "analysis_type": "custom",
-            "optimized_prompt": "Optimized custom prompt",
-            "analysis_result": '{"custom_output": "Flexible custom analysis result", "processing_notes": "Used generic analyzer"}',
-            "system_prompt": "Custom system prompt",
-            "services_used": {"primary": "openai_generic", "fallback": None},
-            "metadata": {
-                "processing_time": 2.0,
-                "ai_service": "openai_generic"
-            }
-        }
-        
-        self._authenticate()
-
-        response = self.client.post(
-            "/process",
-            json={
-                "user_input": "Custom analysis request",
-                "analysis_type": "custom",
-                "options": {"temperature": 0.7}
-            }
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["analysis_type"] == "custom"
-
-        result = json.loads(data["analysis_result"])
-        assert "custom_output" in result
-        assert "services_used" in data
-    
-    @patch('app.services.analysis_service.analysis_service.perform_analysis_with_logging')
-    def test_legacy_crypto_analysis_still_works(self, mock_analyze):
+    async def test_legacy_crypto_analysis_still_works(self, mock_legacy_analysis, client):
         """Test that legacy /analyze endpoint still works for crypto."""
-        mock_analyze.return_value = (
+        mock_legacy_analysis.return_value = (
             "Optimized crypto prompt",
             '{"price_analysis": "Bitcoin showing bullish trend", "market_cap": "$1T", "volume": "$50B"}'
         )
-        
-        self._authenticate()
 
-        response = self.client.post(
-            "/analyze",
-            json={"user_input": "Analyze Bitcoin"}
+        _authenticate(client)
+
+        response = await client.post(
+            "/analyze", content=_ANALYZE_BODY, headers=_JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -201,73 +229,34 @@ class TestGenericProcessingEndpoint:
         assert "analysis" in data
 
         # The legacy endpoint returns the analysis as a string
-        result = json.loads(data["analysis"])
+        result = orjson.loads(data["analysis"])
         assert "price_analysis" in result
-    
-    def test_process_without_auth(self):
-        """Test that /process requires authentication."""
-        response = self.client.post(
-            "/process",
-            json={
-                "user_input": "Test input",
-                "analysis_type": "document"
-            }
-        )
-        assert response.status_code == 401
-        assert "error" in response.json()
-    
-    def test_process_invalid_analysis_type(self):
-        """Test /process with invalid analysis type."""
-        self._authenticate()
-
-        response = self.client.post(
-            "/process",
-            json={
-                "user_input": "Test input",
-                "analysis_type": "invalid_type"
-            }
-        )
 
-        assert response.status_code == 422  # Validation error
-    
-    def test_process_missing_input(self):
-        """Test /process with missing user_input."""
-        self._authenticate()
+    @pytest.mark.parametrize("authenticated, body, expected_status", [
+        (False, _DOCUMENT_BODY, 401),
+        (True, _INVALID_TYPE_BODY, 422),
+        (True, _MISSING_INPUT_BODY, 422),
+    ], ids=["no_auth", "invalid_type", "missing_input"])
+    async def test_process_rejects_bad_requests(self, client, authenticated,
+                                                body, expected_status):
+        """Test the 4xx paths: missing auth, bad type, missing input."""
+        if authenticated:
+            _authenticate(client)
 
-        response = self.client.post(
-            "/process",
-            json={"analysis_type": "document"}
-        )
+        response = await client.post("/process", content=body, headers=_JSON_HEADERS)
 
-        assert response.status_code == 422  # Validation error
+        assert response.status_code == expected_status
         assert "error" in response.json()
-    
-    @patch('app.services.analysis_service.analysis_service.analyze_generic')
-    def test_process_with_options(self, mock_analyze):
+
+    async def test_process_with_options(self, mock_analyze, client):
         """Test /process endpoint with custom options."""
-        mock_analyze.return_value = {
-            "analysis_type": "document",
-            "optimized_prompt": "Optimized prompt with options",
-            "analysis_result": '{"processed": "with options"}',
-            "system_prompt": "System prompt",
-            "services_used": {"primary": "openai_document", "fallback": None},
-            "metadata": {"options_received": {"max_length": 500}}
-        }
-        
-        self._authenticate()
-
-        response = self.client.post(
-            "/process",
-            json={
-                "user_input": "Test with options",
-                "analysis_type": "document",
-                "options": {"max_length": 500, "format": "markdown"}
-            }
+        mock_analyze.return_value = _OPTIONS_RESULT
+
+        _authenticate(client)
+
+        response = await client.post(
+            "/process", content=_OPTIONS_BODY, headers=_JSON_HEADERS
         )
 
         assert response.status_code == 200
-        data = response.json()
-        # Verify basic response structure
-        assert "optimized_prompt" in data
-        assert "analysis_result" in data
-        assert "services_used" in data
+        _assert_response_shape(response.json())